@@ -1,10 +1,16 @@
 # ── Rutas ──────────────────────────────────────────────────────────────────
-# APP_DIR: Path          # directorio del ejecutable
-# DATA_DIR: Path         # datos persistentes (JSON, logs)
-# ARENA_JSON: Path       # games data para Arena
-# RACING_JSON: Path      # games data para Racing
-# COLA_JSON: Path        # datos de máquinas y colas
-# LOG_PATH: Path         # archivo de log
+import sys
+from pathlib import Path
+from typing import Final
+
+APP_DIR: Final[Path] = (                                # directorio del ejecutable
+    Path(sys.executable).resolve().parent if getattr(sys, "frozen", False)
+    else Path(__file__).resolve().parent)
+DATA_DIR: Final[Path] = APP_DIR / "data"                # datos persistentes (JSON, logs)
+ARENA_JSON: Final[Path] = DATA_DIR / "arena.json"       # games data para Arena
+RACING_JSON: Final[Path] = DATA_DIR / "racing.json"     # games data para Racing
+COLA_JSON: Final[Path] = DATA_DIR / "cola.json"         # datos de máquinas y colas
+LOG_PATH: Final[Path] = DATA_DIR / "launcher.log"       # archivo de log
 
 # ── Aplicación ─────────────────────────────────────────────────────────────
 APP_NAME: str = "ZonaVRLauncher"